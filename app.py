@@ -1,13 +1,52 @@
-from flask import Flask, render_template, request, redirect, url_for, flash
+from flask import (
+    Flask, Response, render_template, request, redirect, url_for, flash, abort, jsonify, session,
+    stream_with_context
+)
+from flask.json.provider import DefaultJSONProvider
 from flask_wtf import CSRFProtect
-
-from models import db, Sighting, Harvest, Animal
-from forms import SightingForm, HarvestForm, ANIMAL_CHOICES
-from werkzeug.utils import secure_filename
+from flask_caching import Cache
+
+from models import db, Sighting, Harvest, Animal, normalize_hex_color, to_epoch
+from forms import (
+    SightingForm, HarvestForm, ANIMAL_CHOICES, ANIMAL_CHOICES_TUPLES, ANIMAL_CHOICES_JSON,
+    ANIMAL_CHOICES_JSON_BY_CATEGORY
+)
+from sqlalchemy import LargeBinary, MetaData, Table, event, func, inspect, make_url, select, text
+from sqlalchemy.orm import Session, joinedload, object_session
 from datetime import datetime
+import hashlib
 import os
+import tempfile
+from pathlib import Path
+import orjson
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    JSON provider backed by orjson (C-level encoder).
+    Also used by the Jinja |tojson filter for sightings_json / harvests_json.
+    Keyword options meant for the stdlib encoder (sort_keys, indent, ...) are
+    ignored; key order does not matter to the map JS.
+    """
+
+    def dumps_bytes(self, obj):
+        """Serialize straight to UTF-8 bytes (no str round-trip)."""
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS)
+
+    def dumps(self, obj, **kwargs):
+        return self.dumps_bytes(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """jsonify() path: hand orjson's bytes to the response as-is."""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj), mimetype=self.mimetype)
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)  # must be set before the Jinja env is created
 
 # -------------------
 # CORE CONFIG
@@ -16,11 +55,21 @@ app = Flask(__name__)
 # Secret key for session management (env override -> fallback)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY') or 'dev-fallback-key'
 
+# Production mode (FLASK_ENV=production): no template auto-reload / debugger
+IS_PRODUCTION = os.environ.get('FLASK_ENV') == 'production'
+if IS_PRODUCTION:
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+
 # Upload folder and size cap
 UPLOAD_FOLDER = 'static/uploads'
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+# Resolved once; the upload helper joins stored names onto this
+UPLOAD_ROOT = Path(UPLOAD_FOLDER).resolve()
+# Photo extensions kept on stored names (same list as the forms' FileAllowed)
+UPLOAD_EXTENSIONS = frozenset(('.jpg', '.jpeg', '.png', '.gif'))
 app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024  # 10 MB
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MB chunks when streaming uploads to disk
 
 # ---------------------------------------
 # Database config (env or local sqlite)
@@ -32,14 +81,140 @@ if not database_url:
     db_path = db_path.replace('\\', '/')  # important on Windows
     database_url = f"sqlite:///{db_path}"
 
+IS_SQLITE = database_url.startswith('sqlite')
+# In-memory SQLite (sqlite://, sqlite:///:memory:) runs on a StaticPool, one shared connection
+_db_url = make_url(database_url)
+IS_MEMORY_SQLITE = IS_SQLITE and (
+    _db_url.database in (None, '', ':memory:') or _db_url.query.get('mode') == 'memory'
+)
+
 app.config['SQLALCHEMY_DATABASE_URI'] = database_url
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# Connection pool: reuse connections (and their PRAGMA setup) across requests.
+# Sizing only applies to a QueuePool; StaticPool (in-memory SQLite) rejects it.
+engine_options = {'pool_pre_ping': True}
+if not IS_MEMORY_SQLITE:
+    engine_options['pool_size'] = 8
+    engine_options['max_overflow'] = 16
+if IS_SQLITE:
+    # Share pooled connections across threads; wait up to 30s on a locked DB
+    engine_options['connect_args'] = {'check_same_thread': False, 'timeout': 30}
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
+
 print("Using DB:", app.config['SQLALCHEMY_DATABASE_URI'])
 
+# CSRF tokens live as long as the session (no per-token expiry), so a
+# revalidated (304) list page never carries a stale token
+app.config['WTF_CSRF_TIME_LIMIT'] = None
+
+# Cache for slowly changing lookups (e.g. the animal filter list).
+# SimpleCache is per-process: the listing / edit-page memos are keyed on data
+# versions, so they are safe in each worker; the animal lookups rely on a short
+# timeout (ANIMAL_CACHE_TIMEOUT) to pick up a seed done by another worker.
+# Set CACHE_REDIS_URL to share one Redis cache (and its invalidation) instead.
+if os.environ.get('CACHE_REDIS_URL'):
+    app.config['CACHE_TYPE'] = 'RedisCache'
+    app.config['CACHE_REDIS_URL'] = os.environ['CACHE_REDIS_URL']
+else:
+    app.config['CACHE_TYPE'] = 'SimpleCache'
+app.config['CACHE_DEFAULT_TIMEOUT'] = 120
+# Animal only changes at seed time; other workers see a seed within this many seconds
+ANIMAL_CACHE_TIMEOUT = 30
+
 # Initialize extensions AFTER all config is set
 db.init_app(app)
 csrf = CSRFProtect(app)
+cache = Cache(app)
+
+# ---------------------------------------
+# SQLite connection pragmas
+# - WAL lets readers keep going while a sighting/harvest is being committed.
+# - Applied once per new DBAPI connection (sqlite only).
+# ---------------------------------------
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",  # 256 MB
+    "cache_size=-65536",    # 64 MB page cache
+)
+
+if IS_SQLITE:
+    with app.app_context():
+        @event.listens_for(db.engine, "connect")
+        def _sqlite_pragmas(dbapi_con, _connection_record):
+            cur = dbapi_con.cursor()
+            for pragma in SQLITE_PRAGMAS:
+                cur.execute(f"PRAGMA {pragma}")
+            cur.close()
+
+# Fallback animal <select> choices when no category is picked (WTForms only reads them)
+_NO_ANIMAL_CHOICES = (("", "Select an animal first"),)
+
+# Category -> animals map as a static, long-cached script for add.html.
+# The version hash goes in the URL so a changed ANIMAL_CHOICES busts the cache.
+_ANIMAL_CHOICES_JS = f"const ANIMAL_CHOICES = {ANIMAL_CHOICES_JSON};\n".encode()
+app.jinja_env.globals['animal_choices_version'] = hashlib.sha256(_ANIMAL_CHOICES_JS).hexdigest()[:12]
+
+# ---------------------------------------
+# List-view column projections
+# - Plain column tuples so the list pages skip ORM object hydration.
+# - Labels match the keys used by the templates / map JSON.
+# - On SQLite, date_time comes back pre-formatted from strftime() so no
+#   datetime objects are built per row; other backends format in Python.
+# ---------------------------------------
+LIST_DATE_FORMAT = '%Y-%m-%d %H:%M'
+
+
+def _list_date(col):
+    """date_time column for list views (formatted in SQL on SQLite)."""
+    if IS_SQLITE:
+        return func.strftime(LIST_DATE_FORMAT, col).label('date_time')
+    return col
+
+
+_SIGHTING_COLS = (
+    Sighting.id,
+    Sighting.marker_color,
+    Sighting.sighting_name,
+    Sighting.animal_name.label('animal'),
+    Sighting.location,
+    _list_date(Sighting.date_time),
+    Sighting.weather,
+    Sighting.wind,
+    Sighting.wind_speed_mph,
+    Sighting.wind_direction,
+    Sighting.humidity_pct,
+    Sighting.temperature,
+    Sighting.lat,
+    Sighting.lng,
+    Sighting.notes,
+    Sighting.photo_filename,
+)
+
+_HARVEST_COLS = (
+    Harvest.id,
+    Harvest.animal_name.label('animal'),
+    Harvest.harvest_name,
+    _list_date(Harvest.date_time),
+    Harvest.weather,
+    Harvest.wind_speed_mph,
+    Harvest.wind_direction,
+    Harvest.humidity_pct,
+    Harvest.weapon_type,
+    Harvest.caliber,
+    Harvest.broadhead,
+    Harvest.location,
+    Harvest.distance_traveled,
+    Harvest.notes,
+    Harvest.photo_filename,
+    Harvest.marker_color,
+    Harvest.shot_lat,
+    Harvest.shot_lng,
+    Harvest.recovery_lat,
+    Harvest.recovery_lng,
+)
 
 # =========================================
 # HELPER FUNCTIONS
@@ -47,23 +222,202 @@ csrf = CSRFProtect(app)
 
 
 def handle_file_upload(file_field):
-    """Safe file upload handler with error checking"""
+    """
+    Safe file upload handler with error checking.
+    The upload is streamed to a temp file while being hashed, then stored as
+    <sha256><ext> so identical photos are only ever written to disk once.
+    Returns the stored filename (or None).
+    """
     if file_field and file_field.filename:
-        filename = secure_filename(file_field.filename)
+        # Stored name is <hash><ext>, so only the extension needs vetting
+        ext = os.path.splitext(file_field.filename)[1].lower()
+        if ext not in UPLOAD_EXTENSIONS:
+            ext = ''
+        tmp_path = None
         try:
-            filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file_field.save(filepath)
+            digest = hashlib.sha256()
+            with tempfile.NamedTemporaryFile(dir=UPLOAD_ROOT, suffix='.part', delete=False) as dst:
+                tmp_path = dst.name
+                # Single pass: hash + write each 1 MB chunk
+                for chunk in iter(lambda: file_field.stream.read(UPLOAD_CHUNK_SIZE), b''):
+                    digest.update(chunk)
+                    dst.write(chunk)
+
+            filename = digest.hexdigest() + ext
+            filepath = UPLOAD_ROOT / filename
+            if filepath.exists():
+                os.unlink(tmp_path)  # same photo already stored
+            else:
+                os.chmod(tmp_path, 0o644)  # temp files are created 0600
+                os.replace(tmp_path, filepath)
             return filename
         except Exception as e:
+            if tmp_path and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
             flash('File upload failed: ' + str(e), 'error')
             return None
     return None
 
+
+@cache.cached(timeout=ANIMAL_CACHE_TIMEOUT, key_prefix='unique_animals')
+def _unique_animals():
+    """
+    Sorted list of animal names for the sightings filter dropdown.
+    Cached because the Animal table only changes when it is (re)seeded;
+    invalidated by _invalidate_animal_cache().
+    """
+    return [name for (name,) in db.session.query(Animal.name).order_by(Animal.name)]
+
+
+@cache.cached(timeout=ANIMAL_CACHE_TIMEOUT, key_prefix='animal_ids')
+def _animal_ids():
+    """
+    Map of animal name -> Animal.id so the add/edit routes can set
+    animal_id directly instead of looking the Animal up on every POST.
+    Invalidated by _invalidate_animal_cache().
+    """
+    return dict(Animal.query.with_entities(Animal.name, Animal.id).all())
+
+
+def _invalidate_animal_cache():
+    """Drop the cached Animal lookups (dropdown list + name -> id map)."""
+    cache.delete_many('unique_animals', 'animal_ids')
+
+
+# ORM writes to Animal invalidate automatically, but only once they commit:
+# the mapper events (fired at flush) just flag the session, and the cache is
+# dropped in after_commit. Invalidating at flush would let a concurrent request
+# re-cache the old committed rows, and a rollback would clear it for nothing.
+# Core/bulk INSERTs bypass mapper events, so those callers must call
+# _invalidate_animal_cache() themselves.
+def _flag_animal_write(_mapper, _connection, target):
+    object_session(target).info['animal_cache_stale'] = True
+
+
+for _evt in ('after_insert', 'after_update', 'after_delete'):
+    event.listen(Animal, _evt, _flag_animal_write)
+
+
+@event.listens_for(Session, 'after_commit')
+def _animal_cache_after_commit(session):
+    if session.info.pop('animal_cache_stale', False):
+        _invalidate_animal_cache()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _animal_cache_after_rollback(session):
+    session.info.pop('animal_cache_stale', None)
+
+
+# ---------------------------------------
+# HTTP revalidation (ETag) for list pages
+# ---------------------------------------
+def _list_version(model):
+    """
+    (row count, max(updated_at)) for 'model': changes when a row is added,
+    edited or deleted. Cached list data is keyed on it too, so a page body
+    always comes from the same data version as its ETag.
+    """
+    return tuple(db.session.query(func.count(model.id), func.max(model.updated_at)).one())
+
+
+def _build_token():
+    """
+    Hash of the app's Python modules and templates, computed once at import.
+    Part of every list ETag, so a deploy that changes code or templates is
+    never answered with a 304 for the old HTML. Same value in every worker.
+    """
+    root = Path(app.root_path)
+    digest = hashlib.sha256()
+    for path in sorted(root.glob('*.py')) + sorted((root / app.template_folder).rglob('*.html')):
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+BUILD_TOKEN = _build_token()
+
+
+def _list_etag(model, version):
+    """
+    ETag for a list page over 'model' at 'version', plus the build token,
+    the (cached) animal list behind the filter dropdown / name lookups, and
+    the session's CSRF seed.
+    """
+    count, latest = version
+    animals = '|'.join(_unique_animals())
+    csrf_seed = session.get('csrf_token', '')
+    key = f"{BUILD_TOKEN}:{model.__tablename__}:{count}:{latest}:{animals}:{csrf_seed}"
+    return hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+def _not_modified(etag):
+    """True when the client's cached copy is current (and no flash is pending)."""
+    return '_flashes' not in session and request.if_none_match.contains(etag)
+
+
+def _revalidate(resp, etag):
+    """Tag a response so the browser revalidates it on every view."""
+    resp.set_etag(etag)
+    resp.cache_control.private = True
+    resp.cache_control.max_age = 0
+    resp.cache_control.must_revalidate = True
+    return resp
+
+
+def _edit_page(model, id, render, cached_render):
+    """
+    GET edit page for 'model' row 'id'. Looks up only the row's updated_at
+    and serves cached_render(id, updated_at, csrf_seed), so a save (new
+    updated_at) or a new session (new CSRF seed) never sees a stale page.
+    Renders uncached while a flash is pending or before the session has a
+    CSRF seed.
+    """
+    csrf_seed = session.get('csrf_token')
+    if not csrf_seed or '_flashes' in session:
+        return render(id)
+    updated_at = db.session.scalar(select(model.updated_at).where(model.id == id))
+    if updated_at is None:
+        abort(404)
+    return cached_render(id, updated_at, csrf_seed)
+
+
 # --------
 # Utilities
 # --------
 
 
+def _row_to_dict(row):
+    """
+    Turn a projected result mapping into a plain dict for templates / JSON,
+    formatting 'date_time' as 'YYYY-MM-DD HH:MM' ('' when missing).
+    """
+    data = dict(row)
+    dt = data.get('date_time')
+    if isinstance(dt, datetime):
+        data['date_time'] = dt.strftime(LIST_DATE_FORMAT)
+    else:
+        data['date_time'] = dt or ''  # already formatted by SQL (or NULL)
+    return data
+
+
+def _stream_json_rows(stmt):
+    """
+    Response streaming the rows of 'stmt' as a JSON array, one row at a
+    time (yield_per batches), so memory stays flat and the first bytes go
+    out immediately. Rows are formatted with _row_to_dict.
+    """
+    def generate():
+        yield b'['
+        sep = b''
+        result = db.session.execute(stmt.execution_options(yield_per=500)).mappings()
+        for row in result:
+            yield sep + app.json.dumps_bytes(_row_to_dict(row))
+            sep = b','
+        yield b']'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
 def safe_float(val):
     """
     Safely convert "val" to "float".
@@ -71,14 +425,30 @@ def safe_float(val):
     typical form behavior where missing fields come through as empty values.
     Any value that cannot be converted to 'float' will also result in 'None'
     """
-    if val in (None, ""):
+    if val is None or val == "":
         return None
+    if type(val) is float:  # already a float: skip the try/except
+        return val
     try:
         return float(val)
     except (ValueError, TypeError):
         return None
 
 
+@app.template_filter('mph')
+def mph_filter(value):
+    """wind_speed_mph for display: '15 mph', '55+ mph' (top bucket), '' if unset."""
+    if value is None:
+        return ''
+    return '55+ mph' if value >= 55 else f'{value} mph'
+
+
+@app.template_filter('pct')
+def pct_filter(value):
+    """humidity_pct for display: '45%', '' if unset."""
+    return '' if value is None else f'{value}%'
+
+
 # -----------------------
 # HOME / LANDING PAGE
 # -----------------------
@@ -87,64 +457,91 @@ def home():
     return render_template('home.html')
 
 
-# @app.route('/')
-# def index():
-#     return render_template('index.html')
-
-
 # -----------------------
 # SIGHTING ROUTES
 # -----------------------
 
 # VIEW ALL SIGHTINGS ======================================
-@app.route('/sightings')
-def view_sightings():
-    # Get filter/sort query params
-    animal_filter = request.args.get('animal')
-    sort_order = request.args.get('sort', 'desc')
-
-    # base query
-    sightings_query = Sighting.query
+def _sightings_stmt(animal_filter, sort_order):
+    """Core select for the sightings list (shared by the page and the JSON feed)."""
+    # base statement: Core select of only the columns the page needs (no ORM objects,
+    # no join: the animal name is stored on the row)
+    stmt = select(*_SIGHTING_COLS)
 
-    # Apply filter
+    # Apply filter by animal_id (cached name -> id) so ix_sighting_animal_date serves filter + sort
     if animal_filter:
-        sightings_query = sightings_query.join(Animal).filter(Animal.name == animal_filter)
+        stmt = stmt.where(Sighting.animal_id == _animal_ids().get(animal_filter))
 
     # Apply sort
     if sort_order == 'asc':
-        sightings_query = sightings_query.order_by(Sighting.date_time.asc())  # <<< CHANGED
+        stmt = stmt.order_by(Sighting.date_time_epoch.asc())  # <<< CHANGED
     else:
-        sightings_query = sightings_query.order_by(Sighting.date_time.desc())  # <<< CHANGED (ensure order_by)
-
-    sightings = sightings_query.all()
-
-    # Build JSON for map
-    sightings_json = [
-        {
-            'id': s.id,
-            'marker_color': s.marker_color,
-            'sighting_name': s.sighting_name,
-            'animal': s.animal.name if s.animal else None,
-            'location': s.location,
-            'date_time': s.date_time.strftime('%Y-%m-%d %H:%M') if s.date_time else '',  # <<< CHANGED: guard None
-            'lat': s.lat,
-            'lng': s.lng,
-            'notes': s.notes,
-            'photo_filename': s.photo_filename
-        } for s in sightings
-    ]
+        stmt = stmt.order_by(Sighting.date_time_epoch.desc())  # <<< CHANGED (ensure order_by)
+
+    return stmt
+
+
+@cache.memoize(timeout=60)
+def _sightings_listing(animal_filter, sort_order, version):
+    """
+    Rows for the sightings table, as plain dicts keyed on the
+    filter/sort args and the table's data version (see _list_version).
+    A write changes the version, so every worker misses and re-reads;
+    no explicit invalidation is needed. Only the data is cached (not the
+    rendered page) so flash messages and CSRF tokens stay per-request.
+    """
+    stmt = _sightings_stmt(animal_filter, sort_order)
+    return [_row_to_dict(r) for r in db.session.execute(stmt).mappings()]
 
-    # Build animal filter list
-    unique_animals = [a.name for a in Animal.query.order_by(Animal.name).all()]
 
-    return render_template(
+def _sightings_args():
+    """
+    Read the animal filter / sort order from the query string.
+    sort is whitelisted to 'asc'/'desc' so junk values can't fan out into
+    extra cache entries; the SQL itself always uses bound parameters.
+    """
+    animal_filter = request.args.get('animal') or None
+    sort_order = 'asc' if request.args.get('sort') == 'asc' else 'desc'
+    return animal_filter, sort_order
+
+
+@app.route('/sightings')
+def view_sightings():
+    # Unchanged data -> 304, skipping the listing + template render
+    version = _list_version(Sighting)
+    etag = _list_etag(Sighting, version)
+    if _not_modified(etag):
+        return _revalidate(Response(status=304), etag)
+
+    # Get filter/sort query params
+    animal_filter, sort_order = _sightings_args()
+
+    # Table rows (cached per data version, see _sightings_listing); the map loads /sightings.json
+    sightings = _sightings_listing(animal_filter, sort_order, version)
+
+    # Build animal filter list (cached, see _unique_animals)
+    unique_animals = _unique_animals()
+
+    html = render_template(
         'index.html',
         sightings=sightings,
-        sightings_json=sightings_json,
         animal_filter=animal_filter,
         sort_order=sort_order,
         unique_animals=unique_animals
     )
+    return _revalidate(Response(html, mimetype='text/html'), etag)
+
+
+# SIGHTINGS MAP JSON FEED =================================
+@app.route('/sightings.json')
+def view_sightings_json():
+    """Stream the (filtered/sorted) sightings as a JSON array (see _stream_json_rows)."""
+    etag = _list_etag(Sighting, _list_version(Sighting))
+    if _not_modified(etag):
+        return _revalidate(Response(status=304), etag)
+
+    stmt = _sightings_stmt(*_sightings_args())
+    return _revalidate(_stream_json_rows(stmt), etag)
 
 
 # ADD NEW SIGHTINGS ========================================
@@ -154,26 +551,22 @@ def view_sightings():
 def add_sighting():
     form = SightingForm()
 
-    # Dynamically update animal choices based on selected category
-    selected_category = request.form.get('animal_category') or form.animal_category.data
-    if selected_category in ANIMAL_CHOICES:
-        form.animal.choices = [(a, a) for a in ANIMAL_CHOICES[selected_category]]
-    else:
-        form.animal.choices = []
-
+    # Animal options are filled client-side (animal_choices.js); SightingForm.validate_animal
+    # checks the posted pick against its category, so no per-request choices here
     if form.validate_on_submit():
         image_file = request.files.get('photo')  # .get avoids KeyError
         filename = handle_file_upload(image_file)  # <<< CHANGED: use helper
 
-        # find Animal by name
-        animal_obj = Animal.query.filter_by(name=form.animal.data).first()
-        if not animal_obj:
+        # resolve Animal id by name (cached, see _animal_ids)
+        animal_id = _animal_ids().get(form.animal.data)
+        if not animal_id:
             flash("Animal not found in database.", "error")
-            return render_template('add.html', form=form, animal_choices=ANIMAL_CHOICES)
+            return render_template('add.html', form=form)
 
         # Create new sighting using all form fields
         new_sighting = Sighting(
-            animal=animal_obj,  # relationship sets animal_id
+            animal_id=animal_id,
+            animal_name=form.animal.data,
             sighting_name=form.sighting_name.data,
             location=form.location.data,
             date_time=form.date_time.data,
@@ -181,9 +574,9 @@ def add_sighting():
             photo_filename=filename,
             weather=form.weather.data,
             wind=form.wind.data,
-            wind_speed=form.wind_speed.data,
+            wind_speed_mph=form.wind_speed.data,
             wind_direction=form.wind_direction.data,
-            humidity=form.humidity.data,
+            humidity_pct=form.humidity.data,
             temperature=form.temperature.data,
             marker_color=form.marker_color.data,
             lat=safe_float(form.lat.data),
@@ -195,57 +588,219 @@ def add_sighting():
         flash('Sighting added!')
         return redirect(url_for('view_sightings'))
 
-    return render_template('add.html', form=form, animal_choices=ANIMAL_CHOICES)
+    return render_template('add.html', form=form)
+
+
+# BULK ADD SIGHTINGS (JSON) ================================
+# Sighting columns a bulk client may send ('animal' name is resolved to animal_id)
+_SIGHTING_BULK_FIELDS = tuple(
+    c.name for c in Sighting.__table__.columns if c.name not in ('id', 'updated_at')  # updated_at: column default
+)
+
+# Text columns a bulk row may set -> max length (None for unbounded Text)
+_SIGHTING_BULK_TEXT = {
+    c.name: c.type.length for c in Sighting.__table__.columns
+    if isinstance(c.type, db.String) and c.name != 'animal_name'  # animal_name: set from animal_id
+}
+
+# Numeric columns a bulk row may set -> (type, min, max); same ranges as the form dropdowns
+_SIGHTING_BULK_NUMBERS = {
+    'wind_speed_mph': (int, 0, 55),  # 55 = "55+ mph"
+    'humidity_pct': (int, 0, 100),
+    'lat': (float, -90.0, 90.0),
+    'lng': (float, -180.0, 180.0),
+}
+
+
+def _bulk_number(field, value, kind, lo, hi):
+    """
+    One numeric bulk field: None for null / '', else a 'kind' (int or float)
+    within [lo, hi]. Numeric strings are accepted; anything else aborts 400.
+    """
+    if value is None or value == '':
+        return None
+    num = value
+    if isinstance(value, str):
+        try:
+            num = kind(value)
+        except ValueError:
+            abort(400, f"Invalid {field}: {value!r}")
+    allowed = (int, float) if kind is float else int
+    if isinstance(num, bool) or not isinstance(num, allowed) or not lo <= num <= hi:
+        abort(400, f"Invalid {field}: {value!r} (expected {kind.__name__} in {lo}..{hi})")
+    return kind(num)
+
+
+@app.route('/sightings/bulk', methods=['POST'])
+def bulk_add_sightings():
+    """
+    Insert many sightings from a JSON array of objects in ONE statement +
+    ONE commit (executemany), instead of an add/commit (and fsync) per row.
+    Every field is type/range checked first (a Core insert skips the ORM
+    validators); a bad field aborts the whole batch with a 400 naming it.
+    Send the CSRF token in the X-CSRFToken header.
+    """
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, list):
+        abort(400, "Expected a JSON array of sightings.")
+
+    animal_ids = _animal_ids()
+    names_by_id = {animal_id: name for name, animal_id in animal_ids.items()}
+    rows = []
+    for item in payload:
+        if not isinstance(item, dict):
+            abort(400, "Each sighting must be a JSON object.")
+
+        # Every row carries every column so executemany sees uniform parameter sets
+        row = {name: item.get(name) for name in _SIGHTING_BULK_FIELDS}
+
+        # Animal: 'animal' name (wins) or 'animal_id'
+        animal = item.get('animal')
+        if animal:
+            if not isinstance(animal, str):
+                abort(400, f"Invalid animal: {animal!r}")
+            row['animal_id'] = animal_ids.get(animal)
+        animal_id = row['animal_id']
+        if isinstance(animal_id, bool) or not isinstance(animal_id, int) or animal_id not in names_by_id:
+            abort(400, f"Unknown animal: {animal or animal_id!r}")
+        row['animal_name'] = names_by_id[animal_id]
+
+        # date_time: ISO 8601 local time without a UTC offset (stored naive, like the forms)
+        date_time = row['date_time']
+        if date_time is None or date_time == '':
+            row['date_time'] = None
+        else:
+            try:
+                row['date_time'] = datetime.fromisoformat(date_time)
+            except (TypeError, ValueError):
+                abort(400, f"Invalid date_time: {date_time!r}")
+            if row['date_time'].tzinfo is not None:
+                abort(400, f"Invalid date_time: {date_time!r} (no UTC offset; send local time)")
+        row['date_time_epoch'] = to_epoch(row['date_time'])  # no mapper events on a Core insert
+
+        for name, max_len in _SIGHTING_BULK_TEXT.items():
+            value = row[name]
+            if value is not None and (not isinstance(value, str) or (max_len and len(value) > max_len)):
+                limit = f" of at most {max_len} characters" if max_len else ""
+                abort(400, f"Invalid {name}: expected a string{limit}")
+
+        for name, (kind, lo, hi) in _SIGHTING_BULK_NUMBERS.items():
+            row[name] = _bulk_number(name, row[name], kind, lo, hi)
+
+        try:
+            row['marker_color'] = normalize_hex_color(row['marker_color'])
+        except ValueError:
+            abort(400, f"Invalid marker_color: {row['marker_color']!r}")
+        rows.append(row)
+
+    if rows:
+        db.session.execute(Sighting.__table__.insert(), rows)
+        db.session.commit()
+
+    return jsonify(inserted=len(rows)), 201
+
+
+# ANIMAL CHOICES SCRIPT ===================================
+@app.route('/animal_choices.js')
+def animal_choices_js():
+    """Serve the prebuilt ANIMAL_CHOICES script; immutable per version hash."""
+    resp = Response(_ANIMAL_CHOICES_JS, mimetype='application/javascript')
+    resp.cache_control.public = True
+    resp.cache_control.max_age = 365 * 24 * 3600
+    resp.cache_control.immutable = True
+    return resp
+
+
+# ANIMALS BY CATEGORY (JSON) ==============================
+@app.get('/api/animals')
+def api_animals():
+    """Animal names for ?category=..., for clients populating the animal select."""
+    category = request.args.get('category')
+    if not category:
+        abort(400, "Missing 'category'.")
+    # Built once at import (forms.ANIMAL_CHOICES_JSON_BY_CATEGORY); unknown category -> []
+    body = ANIMAL_CHOICES_JSON_BY_CATEGORY.get(category, b'[]')
+    return Response(body, mimetype='application/json')
+
+
+# SIGHTINGS API (JSON) ====================================
+API_MAX_LIMIT = 500
+
+
+@app.get('/api/sightings')
+def api_sightings():
+    """A page of sightings as JSON: ?limit= (default 100, max 500) & ?offset=."""
+    limit = min(max(request.args.get('limit', 100, type=int), 1), API_MAX_LIMIT)
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    # Same 'YYYY-MM-DD HH:MM' date_time as the list pages and /sightings.json
+    return jsonify([_row_to_dict(r) for r in Sighting.list_as_dicts(limit, offset)])
+
 
 # VIEW SINGLE SIGHTING ===================================
 
 
 @app.route('/sightings/<int:id>')
 def view_sighting(id):
-    sighting = Sighting.query.get_or_404(id)
+    sighting = Sighting.query.get_or_404(id)  # animal_name is on the row; no join needed
     return render_template('view_sighting.html', sighting=sighting)
 
 
 # EDIT SIGHTING ==============================================
-@app.route('/sightings/<int:id>/edit', methods=['GET', 'POST'])
-def edit_sighting(id):
-    sighting = Sighting.query.get_or_404(id)
-    form = SightingForm(obj=sighting)
-
-    # Ensure choices include the current animal on GET
-    if request.method == 'GET' and sighting.animal:
+def _render_edit_sighting(id):
+    """Edit form prefilled from the sighting, with its category's animals."""
+    sighting = Sighting.query.options(joinedload(Sighting.animal)).get_or_404(id)
+    form = SightingForm(obj=sighting, wind_speed=sighting.wind_speed_mph, humidity=sighting.humidity_pct)
+
+    # Ensure choices include the current animal
+    form.animal.choices = _NO_ANIMAL_CHOICES  # fallback
+    if sighting.animal:
         current_cat = sighting.animal.animal_class
         form.animal_category.data = current_cat
-        if current_cat in ANIMAL_CHOICES:
-            form.animal.choices = [(a, a) for a in ANIMAL_CHOICES[current_cat]]
+        if current_cat in ANIMAL_CHOICES_TUPLES:
+            form.animal.choices = ANIMAL_CHOICES_TUPLES[current_cat]
             form.animal.data = sighting.animal.name
-        else:
-            form.animal.choices = [("", "Select an animal first")]  # fallback
-    else:
-        # Keep animal choices coherent on GET/POST
-        selected_category = request.form.get('animal_category') or form.animal_category.data
-        if selected_category in ANIMAL_CHOICES:
-            form.animal.choices = [(a, a) for a in ANIMAL_CHOICES[selected_category]]
-        else:
-            form.animal.choices = [("", "Select an animal first")]  # fallback
+
+    return render_template('edit_sighting.html', form=form, sighting=sighting, animal_choices=ANIMAL_CHOICES)
+
+
+@cache.memoize(timeout=300)
+def _edit_sighting_html(id, updated_at, csrf_seed):
+    return _render_edit_sighting(id)
+
+
+@app.route('/sightings/<int:id>/edit', methods=['GET', 'POST'])
+def edit_sighting(id):
+    # GET: cached page per (id, updated_at), see _edit_page
+    if request.method == 'GET':
+        return _edit_page(Sighting, id, _render_edit_sighting, _edit_sighting_html)
+
+    sighting = Sighting.query.options(joinedload(Sighting.animal)).get_or_404(id)
+    # Prefill the weather selects from the *_mph/*_pct columns (no same-named
+    # attributes), so a POST that omits them keeps the stored values
+    form = SightingForm(obj=sighting, wind_speed=sighting.wind_speed_mph, humidity=sighting.humidity_pct)
+
+    # Keep animal choices coherent with the posted category
+    selected_category = request.form.get('animal_category') or form.animal_category.data
+    form.animal.choices = ANIMAL_CHOICES_TUPLES.get(selected_category, _NO_ANIMAL_CHOICES)
 
     if form.validate_on_submit():
-        animal_obj = Animal.query.filter_by(name=form.animal.data).first()
-        if not animal_obj:
+        animal_id = _animal_ids().get(form.animal.data)
+        if not animal_id:
             flash("Animal not found in database.", "error")
             return render_template('edit_sighting.html', form=form, sighting=sighting, animal_choices=ANIMAL_CHOICES)
 
         # Fields available for editing when editing a sighting
-        sighting.animal = animal_obj
+        sighting.animal_id = animal_id
+        sighting.animal_name = form.animal.data
         sighting.sighting_name = form.sighting_name.data
         sighting.location = form.location.data
         sighting.date_time = form.date_time.data
         sighting.notes = form.notes.data
         sighting.weather = form.weather.data
         sighting.wind = form.wind.data
-        sighting.wind_speed = form.wind_speed.data
+        sighting.wind_speed_mph = form.wind_speed.data
         sighting.wind_direction = form.wind_direction.data
-        sighting.humidity = form.humidity.data
+        sighting.humidity_pct = form.humidity.data
         sighting.temperature = form.temperature.data
         sighting.marker_color = form.marker_color.data
         sighting.lat = safe_float(form.lat.data)
@@ -268,8 +823,10 @@ def edit_sighting(id):
 
 @app.route('/sightings/<int:id>/delete', methods=['POST'])
 def delete_sighting(id):
-    sighting = Sighting.query.get_or_404(id)
-    db.session.delete(sighting)
+    # Single DELETE ... WHERE id = ? (no SELECT to load the row first)
+    deleted = Sighting.query.filter_by(id=id).delete(synchronize_session=False)
+    if not deleted:
+        abort(404)
     db.session.commit()
     flash('Sighting deleted!')
     return redirect(url_for('view_sightings'))
@@ -280,34 +837,52 @@ def delete_sighting(id):
 # ---------------------------------------------------------
 
 # VIEW ALL HARVESTS ========================================
+HARVESTS_PER_PAGE = 50
+
+
+def _harvests_stmt():
+    """Projected harvest rows with the animal name, newest first."""
+    return (
+        select(*_HARVEST_COLS)
+        .order_by(Harvest.date_time.desc(), Harvest.id.desc())
+    )
+
+
 @app.route('/view-harvests')
 def view_all_harvests():
-    harvests = Harvest.query.all()
-    harvests_json = [
-        {
-            'id': h.id,
-            'animal': h.animal.name if h.animal else None,
-            'harvest_name': h.harvest_name,
-            'date_time': h.date_time.strftime('%Y-%m-%d %H:%M') if h.date_time else '',
-            'weather': h.weather,
-            'wind_speed': h.wind_speed,
-            'wind_direction': h.wind_direction,
-            'humidity': h.humidity,
-            'weapon_type': h.weapon_type,
-            'caliber': h.caliber,
-            'broadhead': h.broadhead,
-            'location': h.location,
-            'distance_traveled': h.distance_traveled,
-            'notes': h.notes,
-            'photo_filename': h.photo_filename,
-            'marker_color': h.marker_color,
-            'shot_lat': h.shot_lat,
-            'shot_lng': h.shot_lng,
-            'recovery_lat': h.recovery_lat,
-            'recovery_lng': h.recovery_lng,
-        } for h in harvests
-    ]
-    return render_template('view_harvests.html', harvests=harvests, harvests_json=harvests_json)
+    # Unchanged data -> 304, skipping the query + template render
+    version = _list_version(Harvest)
+    etag = _list_etag(Harvest, version)
+    if _not_modified(etag):
+        return _revalidate(Response(status=304), etag)
+
+    # One page of rows for the table (newest first); out-of-range pages clamp.
+    # The row count comes from the version tuple (no second COUNT query)
+    total = version[0]
+    pages = max(-(-total // HARVESTS_PER_PAGE), 1)
+    page = min(max(request.args.get('page', 1, type=int), 1), pages)
+
+    stmt = (
+        _harvests_stmt()
+        .limit(HARVESTS_PER_PAGE)
+        .offset((page - 1) * HARVESTS_PER_PAGE)
+    )
+    harvests = [_row_to_dict(r) for r in db.session.execute(stmt).mappings()]
+
+    # The map loads every harvest from /harvests.json
+    html = render_template('view_harvests.html', harvests=harvests, page=page, pages=pages)
+    return _revalidate(Response(html, mimetype='text/html'), etag)
+
+
+# HARVESTS MAP JSON FEED =================================
+@app.route('/harvests.json')
+def view_harvests_json():
+    """Stream all harvests as a JSON array for the map (see _stream_json_rows)."""
+    etag = _list_etag(Harvest, _list_version(Harvest))
+    if _not_modified(etag):
+        return _revalidate(Response(status=304), etag)
+
+    return _revalidate(_stream_json_rows(_harvests_stmt()), etag)
 
 
 # ADD HARVEST ====================================================
@@ -318,19 +893,20 @@ def add_harvest():
         photo_file = request.files.get('photo')
         filename = handle_file_upload(photo_file)
 
-        animal_obj = Animal.query.filter_by(name=form.animal.data).first()
-        if not animal_obj:
+        animal_id = _animal_ids().get(form.animal.data)
+        if not animal_id:
             flash("Animal not found in database.", "error")
             return render_template('add_harvest.html', form=form)
 
         new_harvest = Harvest(
-            animal=animal_obj,
+            animal_id=animal_id,
+            animal_name=form.animal.data,
             harvest_name=form.harvest_name.data,
             date_time=form.date_time.data,
             weather=form.weather.data,
-            wind_speed=form.wind_speed.data,
+            wind_speed_mph=form.wind_speed.data,
             wind_direction=form.wind_direction.data,
-            humidity=form.humidity.data,
+            humidity_pct=form.humidity.data,
             weapon_type=form.weapon_type.data,
             other_weapon_type=form.other_weapon_type.data,
             caliber=form.caliber.data,
@@ -345,7 +921,8 @@ def add_harvest():
             distance_traveled=safe_float(form.distance_traveled.data),
             notes=form.notes.data,
             photo_filename=filename,
-            marker_color=form.marker_color.data
+            # Blank -> None so the INSERT omits it and marker_color's server default applies
+            marker_color=form.marker_color.data or None
         )
         db.session.add(new_harvest)
         db.session.commit()
@@ -359,30 +936,49 @@ def add_harvest():
 
 @app.route('/harvests/<int:id>')
 def view_harvest(id):
-    harvest = Harvest.query.get_or_404(id)
+    harvest = Harvest.query.get_or_404(id)  # animal_name is on the row; no join needed
     return render_template('view_harvest.html', harvest=harvest)
 
 # EDIT HARVEST ================================================
 
 
+def _render_edit_harvest(id):
+    """Edit form prefilled from the harvest."""
+    harvest = Harvest.query.options(joinedload(Harvest.animal)).get_or_404(id)
+    form = HarvestForm(obj=harvest, wind_speed=harvest.wind_speed_mph, humidity=harvest.humidity_pct)
+    return render_template('edit_harvest.html', form=form, harvest=harvest)
+
+
+@cache.memoize(timeout=300)
+def _edit_harvest_html(id, updated_at, csrf_seed):
+    return _render_edit_harvest(id)
+
+
 @app.route('/harvests/<int:id>/edit', methods=['GET', 'POST'])
 def edit_harvest(id):
-    harvest = Harvest.query.get_or_404(id)
-    form = HarvestForm(obj=harvest)
+    # GET: cached page per (id, updated_at), see _edit_page
+    if request.method == 'GET':
+        return _edit_page(Harvest, id, _render_edit_harvest, _edit_harvest_html)
+
+    harvest = Harvest.query.options(joinedload(Harvest.animal)).get_or_404(id)
+    # Same prefill as _render_edit_harvest: edit_harvest.html doesn't post the
+    # weather selects, and they must not be saved back as NULL
+    form = HarvestForm(obj=harvest, wind_speed=harvest.wind_speed_mph, humidity=harvest.humidity_pct)
 
     if form.validate_on_submit():
-        animal_obj = Animal.query.filter_by(name=form.animal.data).first()
-        if not animal_obj:
+        animal_id = _animal_ids().get(form.animal.data)
+        if not animal_id:
             flash("Animal not found in database.", "error")
             return render_template('edit_harvest.html', form=form, harvest=harvest)
-        harvest.animal = animal_obj
+        harvest.animal_id = animal_id
+        harvest.animal_name = form.animal.data
 
         harvest.harvest_name = form.harvest_name.data
         harvest.date_time = form.date_time.data
         harvest.weather = form.weather.data
-        harvest.wind_speed = form.wind_speed.data
+        harvest.wind_speed_mph = form.wind_speed.data
         harvest.wind_direction = form.wind_direction.data
-        harvest.humidity = form.humidity.data
+        harvest.humidity_pct = form.humidity.data
         harvest.weapon_type = form.weapon_type.data
         harvest.other_weapon_type = form.other_weapon_type.data
         harvest.caliber = form.caliber.data
@@ -417,33 +1013,165 @@ def edit_harvest(id):
 
 @app.route('/harvests/<int:id>/delete', methods=['POST'])
 def delete_harvest(id):
-    harvest = Harvest.query.get_or_404(id)
-    db.session.delete(harvest)
+    # Single DELETE ... WHERE id = ? (no SELECT to load the row first)
+    deleted = Harvest.query.filter_by(id=id).delete(synchronize_session=False)
+    if not deleted:
+        abort(404)
     db.session.commit()
     flash('Harvest deleted!')
     return redirect(url_for('view_all_harvests'))
 
 
+# -----------------------
+# Template warm-up
+# -----------------------
+
+
+def warm_templates():
+    """
+    Compile every template once at import so the first request to each
+    page doesn't pay Jinja's parse/compile cost (and forked workers share it).
+    """
+    for name in app.jinja_env.list_templates(extensions=['html']):
+        app.jinja_env.get_template(name)
+
+
+warm_templates()
+
+
+# -----------------------
+# Seed data
+# -----------------------
+def seed_animals():
+    """
+    Insert every ANIMAL_CHOICES name missing from the Animal table in one
+    executemany INSERT + one commit. On SQLite, INSERT OR IGNORE skips names
+    already present (Animal.name is unique); other backends filter them out
+    first. Returns the number of rows inserted.
+    """
+    rows = [
+        {'name': name, 'animal_class': category}
+        for category, names in ANIMAL_CHOICES.items()
+        for name in names
+    ]
+    stmt = Animal.__table__.insert()  # Core insert: result carries the executemany rowcount
+    if IS_SQLITE:
+        stmt = stmt.prefix_with('OR IGNORE')
+    else:
+        existing = set(db.session.scalars(select(Animal.name)))
+        rows = [row for row in rows if row['name'] not in existing]
+        if not rows:
+            return 0
+
+    inserted = db.session.execute(stmt, rows).rowcount
+    db.session.commit()
+    _invalidate_animal_cache()  # bulk INSERT skips the mapper events
+    return inserted
+
+
+# -----------------------
+# Schema upgrade (existing DBs)
+# -----------------------
+def _needs_rebuild(inspector, table):
+    """True when the DB's copy of 'table' lacks model columns or still stores marker_color as text."""
+    if not inspector.has_table(table.name):
+        return False
+    columns = {c['name']: c['type'] for c in inspector.get_columns(table.name)}
+    return (
+        not set(table.columns.keys()) <= columns.keys()
+        or not isinstance(columns['marker_color'], LargeBinary)
+    )
+
+
+def _legacy_int(value):
+    """Old free-text weather value -> int: '10 mph' -> 10, '55+ mph' -> 55, '45%' -> 45; None if unparseable."""
+    if value is None:
+        return None
+    try:
+        return int(str(value).split()[0].rstrip('+%'))
+    except (IndexError, ValueError):
+        return None
+
+
+def _upgrade_row(table, old, names_by_id):
+    """One old row -> values for the rebuilt 'table', filling columns it didn't have."""
+    row = {name: old.get(name) for name in table.columns.keys()}
+    row['animal_name'] = row['animal_name'] or names_by_id.get(row['animal_id'], '')
+    if 'date_time_epoch' in row:
+        row['date_time_epoch'] = to_epoch(row['date_time'])
+    row['updated_at'] = row['updated_at'] or datetime.utcnow()
+
+    # wind_speed / humidity were strings ('10 mph', '45%'), now small integers
+    if row['wind_speed_mph'] is None:
+        row['wind_speed_mph'] = _legacy_int(old.get('wind_speed'))
+    if row['humidity_pct'] is None:
+        row['humidity_pct'] = _legacy_int(old.get('humidity'))
+
+    # marker_color was VARCHAR '#rrggbb' (keep valid ones), now 3 bytes
+    color = row['marker_color']
+    if isinstance(color, (bytes, memoryview)):
+        color = '#' + bytes(color).hex()
+    try:
+        row['marker_color'] = normalize_hex_color(color)
+    except ValueError:
+        row['marker_color'] = None
+    return row
+
+
+def upgrade_schema():
+    """
+    One-off upgrade for databases created before the current schema
+    (date_time_epoch, animal_name, updated_at, integer wind speed/humidity,
+    binary marker_color, new indexes): db.create_all() never alters an existing table, so each
+    out-of-date sighting/harvest table is read, dropped, recreated from its
+    model and its rows copied back in one transaction.
+    Returns the number of rows copied (0 when nothing needed upgrading).
+    """
+    copied = 0
+    with db.engine.begin() as conn:
+        inspector = inspect(conn)
+        names_by_id = {}
+        if inspector.has_table(Animal.__tablename__):
+            names_by_id = dict(conn.execute(select(Animal.id, Animal.name)).all())
+
+        for model in (Sighting, Harvest):
+            table = model.__table__
+            if not _needs_rebuild(inspector, table):
+                continue
+            old_table = Table(table.name, MetaData(), autoload_with=conn)
+            rows = [_upgrade_row(table, r, names_by_id) for r in conn.execute(old_table.select()).mappings()]
+            old_table.drop(conn)
+            table.create(conn)
+            if rows:
+                conn.execute(table.insert(), rows)
+            copied += len(rows)
+    return copied
+
+
 # -----------------------
 # Run the App
 # -----------------------
 
 if __name__ == '__main__':
     with app.app_context():
+        # Bring a DB from before the current schema up to date (no-op otherwise)
+        upgraded = upgrade_schema()
+        if upgraded:
+            print(f"Upgraded schema; copied {upgraded} rows.")
+
         db.create_all()
 
         # Optional DEV SEED:
         # Insert animals if the table is empty (or insert any missing ones).
         # Remove this block in production or guard with an env flag.
-        existing = {a.name for a in Animal.query.with_entities(Animal.name).all()}
-        to_insert = []
-        for category, names in ANIMAL_CHOICES.items():
-            for name in names:
-                if name not in existing:
-                    to_insert.append(Animal(name=name, animal_class=category))
-        if to_insert:
-            db.session.add_all(to_insert)
+        seeded = seed_animals()
+        if seeded:
+            print(f"Seeded {seeded} animals.")
+
+        # Refresh SQLite planner stats so it picks ix_sighting_animal_date for filter + sort
+        if IS_SQLITE:
+            db.session.execute(text('ANALYZE'))
             db.session.commit()
-            print(f"Seeded {len(to_insert)} animals.")
 
-    app.run(debug=True)
+    # Dev server only; production runs under gunicorn (see gunicorn.conf.py)
+    app.run(debug=not IS_PRODUCTION)
@@ -5,6 +5,7 @@ forms.py
 - Each form includes fields, widgets, and validation rules for clean user input.
 """
 
+import orjson
 from flask_wtf import FlaskForm
 from wtforms import (
     StringField,
@@ -16,8 +17,9 @@ from wtforms import (
     HiddenField,
     DateTimeField
 )
-from wtforms.validators import DataRequired, Optional, Length
-from wtforms.widgets import ColorInput
+from wtforms.validators import DataRequired, Optional, Length, Regexp, ValidationError
+from wtforms.widgets import ColorInput, Select, html_params
+from markupsafe import Markup
 from flask_wtf.file import FileAllowed
 
 # ----------------------------
@@ -72,7 +74,114 @@ ANIMAL_CHOICES = {
 }
 
 # Flat list where value == label so it matches the Animal table exactly
-FLAT_ANIMALS = [(name, name) for group in ANIMAL_CHOICES.values() for name in group]
+FLAT_ANIMALS = tuple((name, name) for group in ANIMAL_CHOICES.values() for name in group)
+
+# Per-category (value, label) tuples for the cascading animal <select>,
+# built once at import; views assign these directly to form.animal.choices
+ANIMAL_CHOICES_TUPLES = {cat: tuple((name, name) for name in names) for cat, names in ANIMAL_CHOICES.items()}
+
+# HarvestForm's animal dropdown: placeholder + every animal, one shared tuple
+_ALL_ANIMALS = (("", "Select animal"),) + FLAT_ANIMALS
+
+# Valid animal names (all, and per category) as frozensets: one hash lookup per
+# validation instead of WTForms' linear scan over the choices
+_VALID_ANIMALS = frozenset(name for name, _ in FLAT_ANIMALS)
+_VALID_ANIMALS_BY_CATEGORY = {cat: frozenset(names) for cat, names in ANIMAL_CHOICES.items()}
+
+# ANIMAL_CHOICES pre-serialized for the browser-side category -> animal cascade
+ANIMAL_CHOICES_JSON = orjson.dumps(ANIMAL_CHOICES).decode()
+
+# One category's animal names, pre-serialized (bytes) for /api/animals
+ANIMAL_CHOICES_JSON_BY_CATEGORY = {cat: orjson.dumps(names) for cat, names in ANIMAL_CHOICES.items()}
+
+# Weather dropdowns shared by both forms; tuples so SelectField's copy() of
+# the choices on every form instance is a no-op. Values are the integers stored
+# in wind_speed_mph / humidity_pct (55 is the "55+ mph" bucket).
+_WIND_SPEED_CHOICES = (
+    ("", "Select a wind speed"),
+    *((i, f"{i} mph") for i in range(0, 55, 5)),
+    (55, "55+ mph"),
+)
+_HUMIDITY_CHOICES = (("", "Select humidity"), *((i, f"{i}%") for i in range(0, 105, 5)))
+
+
+def _int_or_none(value):
+    """SelectField coerce: the blank placeholder becomes None, anything else an int."""
+    return None if value is None or value == "" else int(value)
+
+
+# Marker color format ('#rrggbb', same rule as models.normalize_hex_color)
+_HEX_COLOR_PATTERN = r'^#[0-9a-fA-F]{6}$'
+
+
+# SightingForm category dropdown
+_CATEGORY_CHOICES = (("", "Select category"), *((k, k) for k in ANIMAL_CHOICES))
+
+# HarvestForm weapon / caliber / broadhead dropdowns
+_WEAPON_CHOICES = (
+    ('', 'Select weapon type'),
+    ('Recurve Bow', 'Recurve Bow'),
+    ('Longbow', 'Longbow'),
+    ('Compound Bow', 'Compound Bow'),
+    ('Crossbow', 'Crossbow'),
+    ('Shotgun', 'Shotgun'),
+    ('Rifle', 'Rifle'),
+    ('Muzzleloader', 'Muzzleloader'),
+    ('Other', 'Other'),
+)
+_CALIBER_CHOICES = (
+    ("", "Select caliber or Gauge"),
+    ("12ga", "12 Gauge"),
+    ("20ga", "20 Gauge"),
+    ("28ga", "28 Gauge"),
+    (".223", ".223 Remington"),
+    (".243", ".243 Winchester"),
+    (".270", ".270 Winchester"),
+    (".30-06", ".30-06 Springfield"),
+    (".308", ".308 Winchester"),
+    ("Other", "Other"),
+)
+_BROADHEAD_CHOICES = (
+    ('', 'Select broadhead type'),
+    ('Fixed Blade', 'Fixed Blade'),
+    ('Mechanical', 'Mechanical'),
+    ('Hybrid', 'Hybrid'),
+    ('Other', 'Other'),
+)
+
+
+class CachedSelect(Select):
+    """
+    Select widget for a fixed choices tuple: the <option> markup is rendered
+    once here and reused, and the current value is marked selected with a
+    single string replace instead of WTForms' per-option loop.
+    Falls back to the stock Select if a view swaps in other choices.
+    """
+
+    def __init__(self, choices):
+        super().__init__()
+        self.choices = choices
+        self._option_tags = {
+            str(value): (self.render_option(value, label, False), self.render_option(value, label, True))
+            for value, label in choices
+        }
+        self._options_html = "".join(plain for plain, _ in self._option_tags.values())
+
+    def __call__(self, field, **kwargs):
+        if field.choices is not self.choices:
+            return super().__call__(field, **kwargs)
+
+        kwargs.setdefault("id", field.id)
+        flags = getattr(field, "flags", {})
+        for k in self.validation_attrs:
+            if k not in kwargs and getattr(flags, k, False):
+                kwargs[k] = True
+
+        options = self._options_html
+        tags = self._option_tags.get(field.data) if isinstance(field.data, str) else None
+        if tags:
+            options = options.replace(*tags, 1)
+        return Markup(f"<select {html_params(name=field.name, **kwargs)}>{options}</select>")
 
 
 # Complete form with SelectField using flat list
@@ -89,14 +198,16 @@ class SightingForm(FlaskForm):
     # Add a category field
     animal_category = SelectField(
         'Animal Category',
-        choices=[("", "Select category")] + [(k, k) for k in ANIMAL_CHOICES.keys()],
+        choices=_CATEGORY_CHOICES,
         validators=[DataRequired()]
     )
 
-    # Animal field - populated dynamically in the view/JS based on category
+    # Animal field - options filled client-side from the chosen category, so
+    # WTForms' choice check is off; validate_animal checks the pick instead
     animal = SelectField(
         'Animal',
         choices=[("", "Select an animal first")],
+        validate_choice=False,
         validators=[DataRequired()]
     )
 
@@ -115,22 +226,25 @@ class SightingForm(FlaskForm):
     # Sightings form class wind speed and validation
     wind_speed = SelectField(
         'Wind Speed (mph)',
-        choices=[("", "Select a wind speed")] + [(f"{i} mph", f"{i} mph") for i in range(0, 55, 5)] + [
-            ("55+ mph", "55+ mph")],
+        choices=_WIND_SPEED_CHOICES,
+        coerce=_int_or_none,
         validators=[Optional()]
     )
 
     # Sightings form class humidity section and validators
     humidity = SelectField(
         'Humidity (%)',
-        choices=[("", "Select humidity")] + [(f"{i}%", f"{i}%") for i in range(0, 105, 5)],
+        choices=_HUMIDITY_CHOICES,
+        coerce=_int_or_none,
         validators=[Optional()]
     )
 
     # Sightings class form validators
     location = StringField('Location', validators=[Optional()])
     notes = TextAreaField('Notes', validators=[Optional()])
-    marker_color = StringField('Marker Color', widget=ColorInput(), validators=[Optional()])
+    marker_color = StringField('Marker Color', widget=ColorInput(), validators=[
+        Optional(), Regexp(_HEX_COLOR_PATTERN, message='Pick a color like #3388ff.')
+    ])
     lat = HiddenField('Latitude')
     lng = HiddenField('Longitude')
 
@@ -143,6 +257,11 @@ class SightingForm(FlaskForm):
     )
     submit = SubmitField('Submit')
 
+    def validate_animal(self, field):
+        # The animal must belong to the selected category
+        if field.data not in _VALID_ANIMALS_BY_CATEGORY.get(self.animal_category.data, ()):
+            raise ValidationError('Not a valid choice.')
+
 
 # -----------------------------------------------------------------------
 # HARVEST LOGGING FORM FLASK ROUTE
@@ -156,7 +275,14 @@ class HarvestForm(FlaskForm):
 
     # Animal Input
     # keep in sync with Animal table by using the flattened list
-    animal = SelectField('Animal', choices=[("", "Select animal")] + FLAT_ANIMALS, validators=[DataRequired()])
+    # validate_choice=False: validate_animal does the membership check as a set lookup
+    animal = SelectField(
+        'Animal',
+        choices=_ALL_ANIMALS,
+        widget=CachedSelect(_ALL_ANIMALS),
+        validate_choice=False,
+        validators=[DataRequired()]
+    )
 
     # harvest date/time
     date_time = DateTimeLocalField(
@@ -172,8 +298,8 @@ class HarvestForm(FlaskForm):
     # Harvest wind speed
     wind_speed = SelectField(
         'Wind Speed (mph)',
-        choices=[("", "Select a wind speed")] + [(f"{i} mph", f"{i} mph") for i in range(0, 55, 5)] + [
-            ("55+ mph", "55+ mph")],
+        choices=_WIND_SPEED_CHOICES,
+        coerce=_int_or_none,
         validators=[Optional()]
     )
 
@@ -183,24 +309,16 @@ class HarvestForm(FlaskForm):
     # Harvest humidity
     humidity = SelectField(
         'Humidity (%)',
-        choices=[("", "Select humidity")] + [(f"{i}%", f"{i}%") for i in range(0, 105, 5)],
+        choices=_HUMIDITY_CHOICES,
+        coerce=_int_or_none,
         validators=[Optional()]
     )
 
     # Weapon / Caliber / Broadhead
     weapon_type = SelectField(
         'Weapon Type',
-        choices=[
-            ('', 'Select weapon type'),
-            ('Recurve Bow', 'Recurve Bow'),
-            ('Longbow', 'Longbow'),
-            ('Compound Bow', 'Compound Bow'),
-            ('Crossbow', 'Crossbow'),
-            ('Shotgun', 'Shotgun'),
-            ('Rifle', 'Rifle'),
-            ('Muzzleloader', 'Muzzleloader'),
-            ('Other', 'Other')
-        ], validators=[Optional()]
+        choices=_WEAPON_CHOICES,
+        validators=[Optional()]
     )
 
     other_weapon_type = StringField(
@@ -209,18 +327,7 @@ class HarvestForm(FlaskForm):
         render_kw={"placeholder": "e.g. Slingbow"}
     )
     # Caliber selector
-    caliber = SelectField('Caliber / Gauge', choices=[
-        ("", "Select caliber or Gauge"),
-        ("12ga", "12 Gauge"),
-        ("20ga", "20 Gauge"),
-        ("28ga", "28 Gauge"),
-        (".223", ".223 Remington"),
-        (".243", ".243 Winchester"),
-        (".270", ".270 Winchester"),
-        (".30-06", ".30-06 Springfield"),
-        (".308", ".308 Winchester"),
-        ("Other", "Other")
-    ], validators=[Optional()])
+    caliber = SelectField('Caliber / Gauge', choices=_CALIBER_CHOICES, validators=[Optional()])
 
     # Other caliber input
     other_caliber = StringField(
@@ -230,13 +337,7 @@ class HarvestForm(FlaskForm):
     )
 
     # Broadhead selector
-    broadhead = SelectField('Broadhead Type', choices=[
-        ('', 'Select broadhead type'),
-        ('Fixed Blade', 'Fixed Blade'),
-        ('Mechanical', 'Mechanical'),
-        ('Hybrid', 'Hybrid'),
-        ('Other', 'Other')
-        ], validators=[Optional()])
+    broadhead = SelectField('Broadhead Type', choices=_BROADHEAD_CHOICES, validators=[Optional()])
 
     # Other broadhead input
     other_broadhead = StringField(
@@ -260,8 +361,13 @@ class HarvestForm(FlaskForm):
     photo = FileField('Upload Photo', validators=[Optional(), FileAllowed(['jpg', 'jpeg', 'png', 'gif'],
     'Images only!')])
 
-    marker_color = StringField('Marker Color', widget=ColorInput(), validators=[Optional()])
+    marker_color = StringField('Marker Color', widget=ColorInput(), validators=[
+        Optional(), Regexp(_HEX_COLOR_PATTERN, message='Pick a color like #3388ff.')
+    ])
 
     submit = SubmitField('Submit')
 
-
+    def validate_animal(self, field):
+        # Any known animal
+        if field.data not in _VALID_ANIMALS:
+            raise ValidationError('Not a valid choice.')
@@ -0,0 +1,32 @@
+# gunicorn.conf.py
+# Production server config:  FLASK_ENV=production gunicorn app:app
+# (gunicorn picks this file up automatically from the working directory)
+
+import multiprocessing
+import os
+
+# Bind address (env override -> fallback)
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+
+# Workers: classic (2 x cores) + 1; threaded workers since the app is sync WSGI
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = 8
+
+# app.py's default cache (SimpleCache) is per worker; its memos are keyed on
+# data versions and the animal lookups expire quickly, so that is safe here.
+# CACHE_REDIS_URL=redis://host:6379/0 shares one cache across workers instead.
+
+# Import the app once in the master and fork: bytecode, compiled templates and
+# SQLAlchemy metadata are shared copy-on-write across workers
+preload_app = True
+
+timeout = 30
+keepalive = 5
+
+
+def post_fork(server, worker):
+    # Never share pooled DB connections across a fork; each worker opens its own
+    from app import app, db
+    with app.app_context():
+        db.engine.dispose(close=False)
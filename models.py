@@ -8,12 +8,83 @@ models.py
 
 NOTE: If you add/remove columns, either run a migration (Flask-Migrate) or
       delete your dev SQLite file (wildlife.db) once and let db.create_all() recreate it.
+      Databases from before the current Sighting/Harvest schema are rebuilt
+      in place by app.upgrade_schema() when app.py starts.
 """
 
+import calendar
+import re
+from datetime import datetime
+from operator import attrgetter
+
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import LargeBinary, event, literal
+from sqlalchemy.orm import validates
+from sqlalchemy.types import TypeDecorator
+
+
+def to_epoch(dt):
+    """
+    datetime -> Unix seconds; None stays None. Naive values are read as UTC
+    (independent of server TZ), aware ones are converted to UTC first.
+    """
+    return None if dt is None else calendar.timegm(dt.utctimetuple())
+
+
+def _utcnow():
+    """Naive UTC timestamp (microsecond precision) for updated_at columns."""
+    return datetime.utcnow()
+
 
 # SQLAlchemy extension instance. The Flask app calls db.init_app(app).
-db = SQLAlchemy()
+# expire_on_commit=False: objects keep their loaded values after commit instead
+# of re-SELECTing on next access (routes redirect right after committing).
+db = SQLAlchemy(session_options={'expire_on_commit': False})
+
+
+# =========================================================
+# HexColor column type
+# - Python side: '#rrggbb' strings (forms, templates, JSON unchanged).
+# - Stored as 3 raw bytes (BLOB/bytea) instead of a 7-char VARCHAR.
+# - normalize_hex_color() runs on attribute set (see the models' @validates)
+#   and again at bind time, so the instance and the row always agree.
+# =========================================================
+HEX_COLOR_RE = re.compile(r'#[0-9a-fA-F]{6}')
+
+
+def normalize_hex_color(value):
+    """'#ABCDEF' -> '#abcdef'; '' / None -> None; ValueError for anything else."""
+    if value is None or value == '':
+        return None
+    if not isinstance(value, str) or not HEX_COLOR_RE.fullmatch(value):
+        raise ValueError(f"Invalid color {value!r}; expected '#rrggbb'")
+    return value.lower()
+
+
+class HexColor(TypeDecorator):
+    impl = LargeBinary(3)
+    cache_ok = True
+
+    @staticmethod
+    def _to_bytes(value):
+        """'#3388ff' -> b'\x33\x88\xff'; None for empty; ValueError if malformed."""
+        value = normalize_hex_color(value)
+        return None if value is None else bytes.fromhex(value[1:])
+
+    def process_bind_param(self, value, dialect):
+        return self._to_bytes(value)
+
+    def process_result_value(self, value, dialect):
+        return None if value is None else '#' + value.hex()
+
+    def literal_processor(self, dialect):
+        # Inline blob literal for DDL (server_default)
+        def process(value):
+            hex_digits = self._to_bytes(value).hex()
+            if dialect.name == 'postgresql':
+                return f"'\\x{hex_digits}'::bytea"
+            return f"X'{hex_digits}'"
+        return process
 
 
 # =========================================================
@@ -32,9 +103,10 @@ class Animal(db.Model):
     # e.g., "Big Game", "Small Game", "Waterfowl", etc.
     animal_class = db.Column(db.String(50), nullable=False)
 
-    # ORM relationships back from Sighting and Harvest
-    sightings = db.relationship('Sighting', backref='animal', lazy=True)
-    harvests = db.relationship('Harvest', backref='animal', lazy=True)
+    # ORM relationships back from Sighting and Harvest. lazy='raise': an
+    # unplanned per-row load fails loudly instead of silently adding N queries
+    sightings = db.relationship('Sighting', back_populates='animal', lazy='raise')
+    harvests = db.relationship('Harvest', back_populates='animal', lazy='raise')
 
     def __repr__(self):
         return f"<Animal id={self.id} name='{self.name}' class='{self.animal_class}'>"
@@ -43,28 +115,45 @@ class Animal(db.Model):
 # =========================================================
 # Sighting Model
 # - Stores all details for a single sighting, including map coords.
-# - Indexed columns (animal_id, date_time) help sorting/filtering as data grows.
+# - date_time is kept for display; date_time_epoch (integer seconds) is what
+#   lists sort on. The composite (animal_id, date_time_epoch) index serves
+#   filter + sort in one scan.
 # =========================================================
 class Sighting(db.Model):
     __tablename__ = 'sighting'
 
+    # Composite index for the list page: filter by animal, then ORDER BY date_time_epoch
+    __table_args__ = (
+        db.Index('ix_sighting_animal_date', 'animal_id', 'date_time_epoch'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
 
-    # FK -> Animal; indexed to speed up joins/filters in lists
-    animal_id = db.Column(db.Integer, db.ForeignKey('animal.id'), nullable=False, index=True)  # <<< indexed
+    # FK -> Animal; lookups/filters use ix_sighting_animal_date (animal_id is its leading column)
+    animal_id = db.Column(db.Integer, db.ForeignKey('animal.id'), nullable=False)
+
+    # Copy of Animal.name, set with animal_id, so lists/to_dict() need no join or lazy load
+    animal_name = db.Column(db.String(100), nullable=False, index=True)
+
+    # The Animal row; lazy='raise', so load it explicitly (joinedload) where needed
+    animal = db.relationship('Animal', back_populates='sightings', lazy='raise')
 
     # Sighting name/title stored in database
     sighting_name = db.Column(db.String(120), nullable=True, index=True)
 
-    # When the sighting occurred; also indexed for fast sort/filter by date
-    date_time = db.Column(db.DateTime, nullable=True, index=True)  # <<< indexed
+    # When the sighting occurred (display); not indexed, lists sort on date_time_epoch
+    date_time = db.Column(db.DateTime, nullable=True)
+
+    # date_time as Unix seconds, set from date_time on every ORM insert/update
+    # (see _sync_date_time_epoch); integer compares for sorts and range scans
+    date_time_epoch = db.Column(db.BigInteger, nullable=True, index=True)
 
     # Weather + context
     weather = db.Column(db.String(100), nullable=True)
     wind = db.Column(db.String(100), nullable=True)
-    wind_speed = db.Column(db.String(100), nullable=True)
+    wind_speed_mph = db.Column(db.SmallInteger, nullable=True)  # 55 = "55+ mph"
     wind_direction = db.Column(db.String(50), nullable=True)
-    humidity = db.Column(db.String(20), nullable=True)
+    humidity_pct = db.Column(db.SmallInteger, nullable=True)
     temperature = db.Column(db.String(20), nullable=True)
 
     # Free-text location label + notes
@@ -72,52 +161,93 @@ class Sighting(db.Model):
     notes = db.Column(db.Text, nullable=True)
 
     # Map marker and coordinates (optional)
-    marker_color = db.Column(db.String(20), nullable=True)
+    marker_color = db.Column(HexColor, nullable=True)
     lat = db.Column(db.Float, nullable=True)
     lng = db.Column(db.Float, nullable=True)
 
     # Optional photo filename (relative path in /static/uploads)
     photo_filename = db.Column(db.String(120), nullable=True)
 
+    # Last write time; the list page's ETag is built from max(updated_at) + count
+    updated_at = db.Column(db.DateTime, nullable=False, default=_utcnow, onupdate=_utcnow, index=True)
+
+    # Scalar columns emitted by to_dict(); read in one C-level attrgetter call
+    _DICT_FIELDS = (
+        "id", "sighting_name", "date_time", "weather", "wind", "wind_speed_mph",
+        "wind_direction", "humidity_pct", "temperature", "location", "notes",
+        "marker_color", "lat", "lng", "photo_filename",
+    )
+    _dict_values = attrgetter(*_DICT_FIELDS)
+
     def to_dict(self):
         """Convenience method for JSON responses / map rendering."""
-        return {
-            "id": self.id,
-            "animal": self.animal.name if self.animal else None,
-            "sighting_name": self.sighting_name,
-            "date_time": self.date_time,
-            "weather": self.weather,
-            "wind": self.wind,
-            "wind_speed": self.wind_speed,
-            "wind_direction": self.wind_direction,
-            "humidity": self.humidity,
-            "temperature": self.temperature,
-            "location": self.location,
-            "notes": self.notes,
-            "marker_color": self.marker_color,
-            "lat": self.lat,
-            "lng": self.lng,
-            "photo_filename": self.photo_filename
-        }
+        data = dict(zip(self._DICT_FIELDS, self._dict_values(self)))
+        data["animal"] = self.animal_name
+        return data
+
+    @classmethod
+    def list_as_dicts(cls, limit, offset=0):
+        """
+        A page of sightings (newest first) as row mappings with the same keys
+        as to_dict(), read with a Core select so no ORM instances are built.
+        date_time is left raw; app._row_to_dict formats it for JSON output.
+        """
+        stmt = (
+            db.select(*(getattr(cls, name) for name in cls._DICT_FIELDS), cls.animal_name.label("animal"))
+            .order_by(cls.date_time_epoch.desc(), cls.id.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return db.session.execute(stmt).mappings().all()
+
+    @validates('marker_color')
+    def _validate_marker_color(self, key, value):
+        # Lowercased '#rrggbb' or None ('' -> None)
+        return normalize_hex_color(value)
 
     def __repr__(self):
-        animal_name = self.animal.name if self.animal else "?"
-        return f"<Sighting id={self.id} animal='{animal_name}' date_time={self.date_time}>"
+        return f"<Sighting id={self.id} animal='{self.animal_name}' date_time={self.date_time}>"
+
+
+def _sync_date_time_epoch(mapper, connection, target):
+    target.date_time_epoch = to_epoch(target.date_time)
+
+
+# Core/bulk INSERTs bypass mapper events; those callers set date_time_epoch themselves
+for _evt in ('before_insert', 'before_update'):
+    event.listen(Sighting, _evt, _sync_date_time_epoch)
 
 
 # =========================================================
 # Harvest Model
 # - Stores complete harvest details (weather, weapon, coords, etc.).
 # - Mirrored with your HarvestForm and routes in app.py.
-# - Indexed columns (animal_id, date_time) help list pages as data grows.
+# - date_time is indexed for the newest-first list; the composite
+#   (animal_id, date_time) index serves filter + sort in one scan
+#   (and animal_id lookups, as its leading column).
 # =========================================================
 class Harvest(db.Model):
     __tablename__ = 'harvest'
 
+    # Composite index: filter by animal, then ORDER BY date_time
+    __table_args__ = (
+        db.Index('ix_harvest_animal_date', 'animal_id', 'date_time'),
+    )
+
+    # Fetch server-generated defaults (marker_color) in the INSERT itself
+    # (RETURNING) rather than expiring them and re-SELECTing on first access
+    __mapper_args__ = {'eager_defaults': True}
+
     id = db.Column(db.Integer, primary_key=True)
 
-    # FK -> Animal; indexed for filters/sorts
-    animal_id = db.Column(db.Integer, db.ForeignKey('animal.id'), nullable=False, index=True)  # <<< indexed
+    # FK -> Animal; lookups/filters use ix_harvest_animal_date (animal_id is its leading column)
+    animal_id = db.Column(db.Integer, db.ForeignKey('animal.id'), nullable=False)
+
+    # Copy of Animal.name, set with animal_id, so lists/to_dict() need no join or lazy load
+    animal_name = db.Column(db.String(100), nullable=False, index=True)
+
+    # The Animal row; lazy='raise', so load it explicitly (joinedload) where needed
+    animal = db.relationship('Animal', back_populates='harvests', lazy='raise')
 
     # A human-friendly name you assign to the harvest (required in form)
     harvest_name = db.Column(db.String(100), nullable=False)
@@ -127,9 +257,9 @@ class Harvest(db.Model):
 
     # Weather bits
     weather = db.Column(db.String(100), nullable=True)
-    wind_speed = db.Column(db.String(50), nullable=True)
+    wind_speed_mph = db.Column(db.SmallInteger, nullable=True)  # 55 = "55+ mph"
     wind_direction = db.Column(db.String(50), nullable=True)
-    humidity = db.Column(db.String(20), nullable=True)
+    humidity_pct = db.Column(db.SmallInteger, nullable=True)
 
     # Weapon / caliber / broadhead (+ "other" text fields)
     weapon_type = db.Column(db.String(50), nullable=True)
@@ -152,36 +282,32 @@ class Harvest(db.Model):
     # Misc
     notes = db.Column(db.Text, nullable=True)
     photo_filename = db.Column(db.String(120), nullable=True)
-    marker_color = db.Column(db.String(20), nullable=True, default="#3388ff")
+    marker_color = db.Column(HexColor, nullable=True, server_default=literal("#3388ff", HexColor))
+
+    # Last write time; the list page's ETag is built from max(updated_at) + count
+    updated_at = db.Column(db.DateTime, nullable=False, default=_utcnow, onupdate=_utcnow, index=True)
+
+    # Scalar columns emitted by to_dict(); read in one C-level attrgetter call
+    _DICT_FIELDS = (
+        "id", "harvest_name", "date_time", "weather", "wind_speed_mph", "wind_direction",
+        "humidity_pct", "weapon_type", "other_weapon_type", "caliber", "other_caliber",
+        "broadhead", "other_broadhead", "location", "shot_lat", "shot_lng",
+        "recovery_lat", "recovery_lng", "distance_traveled", "notes",
+        "photo_filename", "marker_color",
+    )
+    _dict_values = attrgetter(*_DICT_FIELDS)
 
     def to_dict(self):
         """Convenience method for JSON responses / map rendering."""
-        return {
-            "id": self.id,
-            "animal": self.animal.name if self.animal else None,
-            "harvest_name": self.harvest_name,
-            "date_time": self.date_time,
-            "weather": self.weather,
-            "wind_speed": self.wind_speed,
-            "wind_direction": self.wind_direction,
-            "humidity": self.humidity,
-            "weapon_type": self.weapon_type,
-            "other_weapon_type": self.other_weapon_type,
-            "caliber": self.caliber,
-            "other_caliber": self.other_caliber,
-            "broadhead": self.broadhead,
-            "other_broadhead": self.other_broadhead,
-            "location": self.location,
-            "shot_lat": self.shot_lat,
-            "shot_lng": self.shot_lng,
-            "recovery_lat": self.recovery_lat,
-            "recovery_lng": self.recovery_lng,
-            "distance_traveled": self.distance_traveled,
-            "notes": self.notes,
-            "photo_filename": self.photo_filename,
-            "marker_color": self.marker_color
-        }
+        data = dict(zip(self._DICT_FIELDS, self._dict_values(self)))
+        data["animal"] = self.animal_name
+        return data
+
+    @validates('marker_color')
+    def _validate_marker_color(self, key, value):
+        # Lowercased '#rrggbb' or None ('' -> None, so the server default applies on insert)
+        return normalize_hex_color(value)
 
     def __repr__(self):
-        animal_name = self.animal.name if self.animal else "?"
-        return f"<Harvest id={self.id} name='{self.harvest_name}' animal='{animal_name}' date_time={self.date_time}>"
\ No newline at end of file
+        return f"<Harvest id={self.id} name='{self.harvest_name}' animal='{self.animal_name}' date_time={self.date_time}>"
+
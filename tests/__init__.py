@@ -0,0 +1,29 @@
+"""
+Test package setup: point the app at a throwaway SQLite file before any test
+module imports it (app.py reads DATABASE_URL at import time).
+Run from the repo root:  python -m unittest  (or pytest)
+"""
+
+import atexit
+import os
+import tempfile
+
+_db_fd, _db_path = tempfile.mkstemp(suffix='.db')
+os.close(_db_fd)
+os.environ['DATABASE_URL'] = f"sqlite:///{_db_path}"
+
+
+@atexit.register
+def _remove_test_db():
+    for path in (_db_path, _db_path + '-wal', _db_path + '-shm'):
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def create_test_db():
+    """Create the tables and seed the animals (idempotent); call from setUpModule."""
+    from app import app, db, seed_animals
+    app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    with app.app_context():
+        db.create_all()
+        seed_animals()
@@ -0,0 +1,59 @@
+"""
+Edit route regression tests: saving an edit form must keep fields the
+page doesn't post (the weather selects).
+"""
+
+import unittest
+from datetime import datetime
+
+from tests import create_test_db
+from app import app, db
+from models import Animal, Harvest, Sighting
+
+
+def setUpModule():
+    create_test_db()
+
+
+class EditKeepsWeatherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = app.test_client()
+        with app.app_context():
+            self.elk_id = db.session.scalar(db.select(Animal.id).filter_by(name='Elk'))
+
+    def test_edit_harvest_keeps_wind_speed_and_humidity(self):
+        with app.app_context():
+            harvest = Harvest(animal_id=self.elk_id, animal_name='Elk', harvest_name='h1',
+                              wind_speed_mph=20, humidity_pct=60)
+            db.session.add(harvest)
+            db.session.commit()
+            harvest_id = harvest.id
+
+        # Same fields edit_harvest.html posts: no wind_speed / humidity
+        resp = self.client.post(f'/harvests/{harvest_id}/edit', data={'harvest_name': 'h1b', 'animal': 'Elk'})
+        self.assertEqual(resp.status_code, 302)
+
+        with app.app_context():
+            harvest = db.session.get(Harvest, harvest_id)
+            self.assertEqual((harvest.harvest_name, harvest.wind_speed_mph, harvest.humidity_pct), ('h1b', 20, 60))
+
+    def test_edit_sighting_keeps_wind_speed_and_humidity(self):
+        with app.app_context():
+            sighting = Sighting(animal_id=self.elk_id, animal_name='Elk', date_time=datetime(2024, 1, 1),
+                                wind_speed_mph=15, humidity_pct=45)
+            db.session.add(sighting)
+            db.session.commit()
+            sighting_id = sighting.id
+
+        resp = self.client.post(f'/sightings/{sighting_id}/edit',
+                                data={'animal_category': 'Big Game', 'animal': 'Moose'})
+        self.assertEqual(resp.status_code, 302)
+
+        with app.app_context():
+            sighting = db.session.get(Sighting, sighting_id)
+            self.assertEqual((sighting.animal_name, sighting.wind_speed_mph, sighting.humidity_pct), ('Moose', 15, 45))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Sightings list regression tests (Flask test client, temporary SQLite file;
+see tests/__init__.py).
+"""
+
+import re
+import unittest
+from datetime import datetime
+
+from tests import create_test_db
+from app import app, db
+from models import Animal, Sighting
+
+
+def setUpModule():
+    create_test_db()
+
+
+class SightingsSortTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = app.test_client()
+        with app.app_context():
+            db.session.query(Sighting).delete()
+            elk_id = db.session.scalar(db.select(Animal.id).filter_by(name='Elk'))
+            for notes, when in (('older', datetime(2024, 1, 1, 8, 0)), ('newer', datetime(2024, 6, 1, 8, 0))):
+                db.session.add(Sighting(animal_id=elk_id, animal_name='Elk', notes=notes, date_time=when))
+            db.session.commit()
+
+    def _notes_order(self, html):
+        return re.findall(rb'<td>(older|newer)</td>', html)
+
+    def test_sort_asc_lists_oldest_first(self):
+        resp = self.client.get('/sightings?sort=asc')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self._notes_order(resp.data), [b'older', b'newer'])
+
+    def test_default_sort_lists_newest_first(self):
+        resp = self.client.get('/sightings')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self._notes_order(resp.data), [b'newer', b'older'])
+
+    def test_json_feed_follows_sort(self):
+        resp = self.client.get('/sightings.json?sort=asc')
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual([s['notes'] for s in resp.get_json()], ['older', 'newer'])
+
+
+if __name__ == '__main__':
+    unittest.main()